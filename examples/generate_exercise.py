@@ -6,12 +6,10 @@ Example script for generating an exercise using the ExerciseGenerator.
 # %%
 import os
 import sys
-import json
-import yaml
+import orjson
 from pathlib import Path
 from dotenv import load_dotenv
 
-load_dotenv()
 # Add the parent directory to the path to import from grasp modules
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -37,9 +35,10 @@ def main():
     exercise = generate_exercise(prompt, markdown_file=markdown_file)
 
     # Print the generated exercise as JSON
-    print(json.dumps(exercise.model_dump(), indent=2))
+    print(orjson.dumps(exercise.model_dump(), option=orjson.OPT_INDENT_2).decode())
 
-    save_exercise(exercise, formats=["json", "yaml"])
+    # JSON only; pass formats=["json", "yaml"] to also write a YAML copy
+    save_exercise(exercise)
 
 if __name__ == "__main__":
     main()
@@ -8,12 +8,9 @@ for the statistical tutoring system.
 
 import os
 import sys
+import logging
 import argparse
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Add the project root to Python path
 project_root = Path(__file__).parent
@@ -50,6 +47,20 @@ def main():
 
     args = parser.parse_args()
 
+    # Tutor services log per-turn diagnostics at DEBUG level. Only the tutor
+    # loggers are raised: openai/httpx debug logs contain full request bodies
+    # with student answers
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    if args.debug:
+        logging.getLogger("tutor").setLevel(logging.DEBUG)
+
+    # Load environment variables (deferred so that --help stays fast)
+    from dotenv import load_dotenv
+    load_dotenv()
+
     # Check for required environment variables
     if not os.getenv("OPENAI_API_KEY"):
         print("Error: OPENAI_API_KEY not found!")
@@ -0,0 +1,23 @@
+# grasp/tests/conftest.py
+import pytest
+import sys
+from pathlib import Path
+
+# Add the project root to Python's module search path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tutor.exercise_model import Exercise
+from tutor.models.context import TutorContext
+from tutor.models.state import ProgressionState
+
+
+@pytest.fixture
+def tutor_context() -> TutorContext:
+    """A fresh session context on the first step of the example exercise."""
+    return TutorContext(
+        exercise=Exercise.create_example(),
+        progression=ProgressionState(exercise_id="example"),
+        tutor_mode="socratic",
+        user_id="user",
+        session_id="session"
+    )
@@ -0,0 +1,20 @@
+# grasp/tests/test_context.py
+import sys
+from pathlib import Path
+
+# Add the project root to Python's module search path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class TestAddToConversation:
+    def test_trims_history_but_counts_all_messages(self, tutor_context):
+        """Test that the history keeps the latest messages while the length counts all of them."""
+        total = tutor_context.max_conversation_history + 10
+        for i in range(total):
+            tutor_context.add_to_conversation("user", f"Message {i}")
+
+        history = tutor_context.conversation_history
+        assert len(history) == tutor_context.max_conversation_history
+        assert history[0]["content"] == "Message 10"
+        assert history[-1]["content"] == f"Message {total - 1}"
+        assert tutor_context.conversation_length == total
@@ -0,0 +1,99 @@
+# grasp/tests/test_exercise_generator.py
+import pytest
+import orjson
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest import mock
+
+# Add the project root to Python's module search path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("openai")
+pytest.importorskip("dotenv")
+
+from tutor.exercise_generator import ExerciseGenerator
+from tutor.exercise_model import Exercise
+
+
+def make_generator() -> ExerciseGenerator:
+    """Create a generator with a mocked OpenAI client."""
+    generator = ExerciseGenerator.__new__(ExerciseGenerator)
+    generator.client = mock.MagicMock()
+    generator.model = "test-model"
+    return generator
+
+
+def output_line(custom_id: str, exercise: Exercise) -> bytes:
+    return orjson.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": 200, "body": {"output": [{
+            "type": "message",
+            "content": [{"type": "output_text", "text": exercise.model_dump_json()}]
+        }]}},
+        "error": None
+    })
+
+
+def error_line(custom_id: str) -> bytes:
+    return orjson.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": 400, "body": {"error": {
+            "code": "invalid_request", "message": "Bad prompt"
+        }}},
+        "error": None
+    })
+
+
+class TestGenerateMany:
+    def test_concurrent_by_default(self):
+        """Test that prompts are generated with direct requests unless batching is requested."""
+        generator = make_generator()
+        exercise = Exercise.create_example()
+        prompts = [f"Prompt {i}" for i in range(10)]
+
+        with mock.patch.object(generator, "generate", side_effect=[exercise] * 9 + [RuntimeError("boom")]), \
+                mock.patch("tutor.exercise_generator.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            results = generator.generate_many(prompts)
+
+        assert pool.call_args.kwargs["max_workers"] == 4
+
+        assert len(results) == 10
+        assert results.count(None) == 1
+        generator.client.batches.create.assert_not_called()
+
+    def test_batch_collects_output_and_errors(self, capsys):
+        """Test that batch results are returned in order and failures are reported."""
+        generator = make_generator()
+        exercise = Exercise.create_example()
+        client = generator.client
+        client.batches.create.return_value = SimpleNamespace(id="batch_1", status="in_progress")
+        client.batches.retrieve.return_value = SimpleNamespace(
+            id="batch_1", status="completed", output_file_id="out", error_file_id="err"
+        )
+        files = {
+            "out": b"\n".join([output_line("0", exercise), output_line("2", exercise)]),
+            "err": error_line("1"),
+        }
+        client.files.content.side_effect = lambda file_id: SimpleNamespace(read=lambda: files[file_id])
+
+        results = generator.generate_many(["a", "b", "c"], use_batch=True, poll_interval=0)
+
+        assert results[0] == exercise
+        assert results[1] is None
+        assert results[2] == exercise
+        assert "Error generating exercise 1: invalid_request: Bad prompt" in capsys.readouterr().out
+        client.batches.create.assert_called_once()
+        assert client.batches.create.call_args.kwargs["endpoint"] == "/v1/responses"
+
+    def test_batch_cancelled_after_timeout(self):
+        """Test that a batch still running at the timeout is cancelled."""
+        generator = make_generator()
+        client = generator.client
+        client.batches.create.return_value = SimpleNamespace(id="batch_1", status="in_progress")
+
+        with pytest.raises(TimeoutError):
+            generator.generate_many(["a"], use_batch=True, timeout=0, poll_interval=0)
+
+        client.batches.cancel.assert_called_once_with("batch_1")
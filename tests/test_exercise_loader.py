@@ -6,12 +6,14 @@ import yaml
 import json
 import sys
 from pathlib import Path
+from unittest import mock
 
 # Add the project root to Python's module search path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Now imports will work
-from grasp.tutor.exercise_loader import ExerciseLoader
+from grasp.tutor import exercise_loader
+from grasp.tutor.exercise_loader import ExerciseLoader, MODEL_FINGERPRINT
 from grasp.tutor.exercise_model import Exercise, ExerciseMetadata, Checkpoint, Step
 
 
@@ -22,6 +24,44 @@ PROJECT_ROOT = TEST_DIR.parent
 # Path to the example exercises
 EXERCISES_DIR = PROJECT_ROOT / "exercises"
 
+
+def make_exercise_data(title="Test Exercise", image=None):
+    """Build a minimal valid exercise dictionary with one checkpoint and step."""
+    step = {
+        "step_number": 1,
+        "guiding_question": "Guide?",
+        "guiding_answer": "Response."
+    }
+    if image:
+        step["image"] = image
+    return {
+        "metadata": {
+            "title": title,
+            "topic": "Testing",
+            "level": "beginner",
+            "language": "en"
+        },
+        "first_message": "Hi!",
+        "end_message": "Bye!",
+        "checkpoints": [{
+            "checkpoint_number": 1,
+            "main_question": "Question?",
+            "main_answer": "Answer.",
+            "steps": [step]
+        }]
+    }
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path):
+    """Write exercise pickles to a per-test directory instead of the shared temp dir."""
+    cache_dir = tmp_path / "exercise-cache"
+    ExerciseLoader._load_file.cache_clear()
+    with mock.patch.object(exercise_loader, "CACHE_DIR", cache_dir):
+        yield cache_dir
+    ExerciseLoader._load_file.cache_clear()
+
+
 class TestExerciseLoader:
     def test_load_yaml_file(self):
         """Test loading an existing YAML exercise."""
@@ -73,26 +113,7 @@ class TestExerciseLoader:
     def test_create_and_load_yaml(self):
         """Test creating a YAML file and loading it."""
         # Create a temporary YAML file
-        exercise_data = {
-            "metadata": {
-                "title": "Test Exercise",
-                "topic": "Testing",
-                "level": "beginner",
-                "language": "en"
-            },
-            "first_message": "Welcome to the test exercise!",
-            "end_message": "You completed the test exercise!",
-            "checkpoints": [{
-                "checkpoint_number": 1,
-                "main_question": "What is testing?",
-                "main_answer": "Testing verifies that code works as expected.",
-                "steps": [{
-                    "step_number": 1,
-                    "guiding_question": "Why test?",
-                    "guiding_answer": "To catch bugs early."
-                }]
-            }]
-        }
+        exercise_data = make_exercise_data("Test Exercise")
 
         # Create a named temporary file but close it immediately
         temp_file = tempfile.NamedTemporaryFile(suffix=".yaml", delete=False)
@@ -119,25 +140,7 @@ class TestExerciseLoader:
     def test_from_dict(self):
         """Test creating an exercise from a dictionary."""
         # Create sample data
-        data = {
-            "metadata": {
-                "title": "Dictionary Exercise",
-                "topic": "Testing",
-                "language": "en"
-            },
-            "first_message": "Welcome!",
-            "end_message": "Goodbye!",
-            "checkpoints": [{
-                "checkpoint_number": 1,
-                "main_question": "Question?",
-                "main_answer": "Answer.",
-                "steps": [{
-                    "step_number": 1,
-                    "guiding_question": "Guide?",
-                    "guiding_answer": "Response."
-                }]
-            }]
-        }
+        data = make_exercise_data("Dictionary Exercise")
 
         # Create exercise from dictionary
         exercise = ExerciseLoader.from_dict(data)
@@ -147,6 +150,67 @@ class TestExerciseLoader:
         assert len(exercise.checkpoints) == 1
         assert exercise.checkpoints[0].steps[0].guiding_question == "Guide?"
 
+    def test_from_dict_rejects_unsequential_checkpoints(self):
+        """Test that checkpoint numbering is validated when the exercise is loaded."""
+        data = Exercise.create_example().model_dump()
+        data["checkpoints"][0]["checkpoint_number"] = 2
+
+        with pytest.raises(ValueError):
+            ExerciseLoader.from_dict(data)
+
+    def test_load_cache_invalidated_on_change(self, cache_dir):
+        """Test that a cached exercise is not reused after the file changes."""
+        exercise_data = make_exercise_data("Cached")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            exercise_path = os.path.join(tmp_dir, "exercise.yaml")
+            with open(exercise_path, 'w', encoding='utf-8') as file:
+                yaml.dump(exercise_data, file)
+
+            first = ExerciseLoader.load(exercise_path)
+            stat = os.stat(exercise_path)
+            cache_path = ExerciseLoader._cache_path(exercise_path, os.getcwd(),
+                                                   stat.st_size, stat.st_mtime_ns)
+            assert cache_path.exists()
+            assert cache_path.parent == cache_dir
+            assert MODEL_FINGERPRINT in cache_path.name
+
+            # Without the in-process cache, the pickle is read instead of the YAML
+            ExerciseLoader._load_file.cache_clear()
+            with mock.patch.object(ExerciseLoader, "from_yaml",
+                                   side_effect=AssertionError("YAML parsed again")):
+                assert ExerciseLoader.load(exercise_path) == first
+
+            exercise_data["metadata"]["title"] = "Cached and edited"
+            with open(exercise_path, 'w', encoding='utf-8') as file:
+                yaml.dump(exercise_data, file)
+
+            assert ExerciseLoader.load(exercise_path).metadata.title == "Cached and edited"
+
+    def test_load_prefers_newer_json_sidecar(self):
+        """Test that a precompiled JSON sibling is used instead of the YAML file."""
+        exercise_data = make_exercise_data("From YAML", image="figures/step1.png")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yaml_path = os.path.join(tmp_dir, "exercise.yaml")
+            json_path = os.path.join(tmp_dir, "exercise.json")
+            with open(yaml_path, 'w', encoding='utf-8') as file:
+                yaml.dump(exercise_data, file)
+
+            exercise_data["metadata"]["title"] = "From JSON"
+            with open(json_path, 'w', encoding='utf-8') as file:
+                json.dump(exercise_data, file)
+            yaml_mtime = os.stat(yaml_path).st_mtime_ns
+            os.utime(json_path, ns=(yaml_mtime, yaml_mtime + 1))
+
+            exercise = ExerciseLoader.load(yaml_path)
+            assert exercise.metadata.title == "From JSON"
+            assert exercise.checkpoints[0].steps[0].image == os.path.join(tmp_dir, "figures/step1.png")
+
+            # A YAML file edited after compiling takes precedence again
+            os.utime(yaml_path, ns=(yaml_mtime, yaml_mtime + 2))
+            assert ExerciseLoader.load(yaml_path).metadata.title == "From YAML"
+
 
 
 # This allows running this file directly
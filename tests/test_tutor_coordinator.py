@@ -0,0 +1,44 @@
+# grasp/tests/test_tutor_coordinator.py
+import pytest
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add the project root to Python's module search path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("pydantic_ai")
+pytest.importorskip("dotenv")
+
+from tutor.models.responses import Understanding, Feedback, Instructions, TutorTurn
+from tutor.services.tutor_coordinator import TutorCoordinator
+
+
+class TestEvaluateTurn:
+    def test_fills_in_missing_instructions(self, tutor_context):
+        """Test that a turn without instructions gets the empty instructions."""
+        coordinator = TutorCoordinator()
+        turn = TutorTurn(
+            understanding=Understanding(guiding_question_answered=True),
+            feedback=Feedback(feedback="Well done")
+        )
+        coordinator.turn_agent = mock.Mock(run=mock.AsyncMock(return_value=SimpleNamespace(data=turn)))
+
+        result = asyncio.run(coordinator._evaluate_turn("answer", tutor_context))
+
+        assert result.understanding.guiding_question_answered
+        assert result.feedback.feedback == "Well done"
+        assert result.instructions == Instructions.empty()
+
+    def test_agent_failure_returns_empty_turn(self, tutor_context):
+        """Test that an agent error yields empty understanding, feedback and instructions."""
+        coordinator = TutorCoordinator()
+        coordinator.turn_agent = mock.Mock(run=mock.AsyncMock(side_effect=RuntimeError("boom")))
+
+        result = asyncio.run(coordinator._evaluate_turn("answer", tutor_context))
+
+        assert result.understanding == Understanding.empty()
+        assert result.feedback == Feedback.empty()
+        assert result.instructions == Instructions.empty()
@@ -0,0 +1,64 @@
+# grasp/tests/test_understanding_cache.py
+import pytest
+import sys
+from pathlib import Path
+
+# Add the project root to Python's module search path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tutor.models.responses import Understanding
+from tutor.services.understanding_cache import UnderstandingCache, normalize_answer
+
+
+class TestNormalizeAnswer:
+    def test_collapses_case_whitespace_and_trailing_punctuation(self):
+        """Test that cosmetic differences normalize to the same answer."""
+        assert normalize_answer("  I don't   KNOW?! ") == "i don't know"
+        assert normalize_answer("Variance.") == normalize_answer("variance")
+
+    @pytest.mark.parametrize("first, second", [
+        ("p < 0.05", "p > 0.05"),
+        ("H0: mu = 0", "H0: mu != 0"),
+        ("r = -0.8", "r = 0.8"),
+    ])
+    def test_keeps_operators_signs_and_decimals(self, first, second):
+        """Test that answers with opposite meaning stay distinct."""
+        assert normalize_answer(first) != normalize_answer(second)
+
+
+class TestUnderstandingCache:
+    def test_hit_for_repeated_answer(self, tutor_context):
+        """Test that the same answer at the same step is served from the cache."""
+        cache = UnderstandingCache()
+        understanding = Understanding(reasoning="first evaluation")
+
+        assert cache.get("Variance", tutor_context) is None
+        cache.put("Variance", tutor_context, understanding)
+
+        # A new free-text evaluation in between must not prevent the hit
+        tutor_context.current_understanding = Understanding(reasoning="something else")
+        assert cache.get("variance.", tutor_context) is understanding
+
+    def test_miss_on_different_position_or_state(self, tutor_context):
+        """Test that other steps and answered flags use different entries."""
+        cache = UnderstandingCache()
+        cache.put("variance", tutor_context, Understanding())
+
+        tutor_context.current_understanding = Understanding(guiding_question_answered=True)
+        assert cache.get("variance", tutor_context) is None
+
+        tutor_context.current_understanding = Understanding.empty()
+        tutor_context.advance_step()
+        assert cache.get("variance", tutor_context) is None
+
+    def test_evicts_least_recently_used(self, tutor_context):
+        """Test that the cache stays within its size limit."""
+        cache = UnderstandingCache(maxsize=2)
+        cache.put("a", tutor_context, Understanding())
+        cache.put("b", tutor_context, Understanding())
+        cache.get("a", tutor_context)
+        cache.put("c", tutor_context, Understanding())
+
+        assert len(cache) == 2
+        assert cache.get("b", tutor_context) is None
+        assert cache.get("a", tutor_context) is not None
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Precompile exercise YAML files to JSON.
+
+Writes a `.json` file next to every exercise YAML under `exercises/`.
+ExerciseLoader.load prefers the JSON sibling when it is at least as new as
+the YAML file, which avoids YAML parsing at startup. Re-run this script
+after editing an exercise (or just delete the stale `.json`).
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+import orjson
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def compile_exercise(yaml_path: Path) -> Path:
+    """Convert a single exercise YAML file to a JSON file next to it."""
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    json_path = yaml_path.with_suffix('.json')
+    with open(json_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    return json_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompile exercise YAML files to JSON")
+    parser.add_argument(
+        "exercise_dir",
+        nargs="?",
+        default=str(Path(__file__).parent.parent / "exercises"),
+        help="Directory containing exercise bundles (default: exercises/)"
+    )
+    args = parser.parse_args()
+
+    exercise_dir = Path(args.exercise_dir)
+    if not exercise_dir.is_dir():
+        print(f"Error: exercise directory not found: {exercise_dir}")
+        sys.exit(1)
+
+    yaml_files = sorted(exercise_dir.rglob("*.yaml")) + sorted(exercise_dir.rglob("*.yml"))
+    for yaml_path in yaml_files:
+        try:
+            json_path = compile_exercise(yaml_path)
+            print(f"Compiled {yaml_path} -> {json_path}")
+        except (OSError, yaml.YAMLError) as e:
+            print(f"Error compiling {yaml_path}: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 from .understanding_agent import understanding_agent
 from .feedback_agent import feedback_agent
 from .instruction_agent import instruction_agent
+from .turn_agent import turn_agent
 from .base_agent import create_base_agent, BaseAgentConfig
 
 __all__ = [
     "understanding_agent",
     "feedback_agent", 
     "instruction_agent",
+    "turn_agent",
     "create_base_agent",
     "BaseAgentConfig"
 ]
\ No newline at end of file
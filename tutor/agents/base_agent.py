@@ -1,6 +1,6 @@
 import os
 from pydantic import BaseModel
-from pydantic_ai import Agent
+from pydantic_ai import Agent, RunContext
 from dotenv import load_dotenv
 from tutor.models.context import TutorContext
 
@@ -31,4 +31,9 @@ def create_base_agent(
             "max_tokens": config.max_tokens,
             "timeout": config.timeout
         }
-    )
\ No newline at end of file
+    )
+
+def get_conversation_context(ctx: RunContext[TutorContext]) -> str:
+    """Get recent conversation history for context"""
+    recent_messages = ctx.deps.conversation_history[-3:] if ctx.deps.conversation_history else []
+    return "\n".join([f"{msg['role']}: {msg['content']}" for msg in recent_messages])
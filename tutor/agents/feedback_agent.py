@@ -1,7 +1,7 @@
 from pydantic_ai import Agent, RunContext
 from tutor.models.responses import Feedback
 from tutor.models.context import TutorContext
-from tutor.agents.base_agent import create_base_agent
+from tutor.agents.base_agent import create_base_agent, get_conversation_context
 
 FEEDBACK_SYSTEM_PROMPT = """
 You are a supportive statistical tutor providing constructive feedback.
@@ -34,7 +34,7 @@ def get_feedback_prompt(ctx: RunContext[TutorContext]) -> str:
     mode_instructions = get_mode_instructions(ctx.deps.tutor_mode)
     
     return f"""
-    {FEEDBACK_SYSTEM_PROMPT}
+    {mode_instructions}
     
     Current Context:
     - Exercise: {ctx.deps.exercise.metadata.title}
@@ -42,8 +42,6 @@ def get_feedback_prompt(ctx: RunContext[TutorContext]) -> str:
     - Step {ctx.deps.current_step}: {ctx.deps.current_guiding_question}
     - Tutor Mode: {ctx.deps.tutor_mode}
     
-    {mode_instructions}
-    
     Main Question and Full Answer:
     {ctx.deps.current_main_question}
     
@@ -57,7 +55,7 @@ def get_feedback_prompt(ctx: RunContext[TutorContext]) -> str:
     Current Understanding:
     - Main question answered: {ctx.deps.current_understanding.main_question_answered}
     - Guiding question answered: {ctx.deps.current_understanding.guiding_question_answered}
-    - Summary: {ctx.deps.current_understanding.summary_text()}
+    - Summary: {ctx.deps.current_understanding.summary_text}
     
     Provide constructive feedback following your guidelines and tutor mode.
     """
@@ -82,8 +80,4 @@ def get_mode_instructions(mode: str) -> str:
         """
     return ""
 
-@feedback_agent.tool
-def get_conversation_context(ctx: RunContext[TutorContext]) -> str:
-    """Get recent conversation history for context"""
-    recent_messages = ctx.deps.conversation_history[-3:] if ctx.deps.conversation_history else []
-    return "\n".join([f"{msg['role']}: {msg['content']}" for msg in recent_messages])
\ No newline at end of file
+feedback_agent.tool(get_conversation_context)
\ No newline at end of file
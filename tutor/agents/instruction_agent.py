@@ -36,7 +36,7 @@ def get_instruction_prompt(ctx: RunContext[TutorContext]) -> str:
     mode_instructions = get_mode_specific_instructions(ctx.deps.tutor_mode)
     
     return f"""
-    {INSTRUCTION_SYSTEM_PROMPT}
+    {mode_instructions}
     
     Current Context:
     - Exercise: {ctx.deps.exercise.metadata.title}
@@ -44,8 +44,6 @@ def get_instruction_prompt(ctx: RunContext[TutorContext]) -> str:
     - Step {ctx.deps.current_step}: {ctx.deps.current_guiding_question}
     - Tutor Mode: {ctx.deps.tutor_mode}
     
-    {mode_instructions}
-    
     Main Question and Full Answer:
     {ctx.deps.current_main_question}
     
@@ -59,7 +57,7 @@ def get_instruction_prompt(ctx: RunContext[TutorContext]) -> str:
     Current Understanding:
     - Main question answered: {ctx.deps.current_understanding.main_question_answered}
     - Guiding question answered: {ctx.deps.current_understanding.guiding_question_answered}
-    - Summary: {ctx.deps.current_understanding.summary_text()}
+    - Summary: {ctx.deps.current_understanding.summary_text}
     
     Generate helpful instructions that guide the student toward understanding.
     """
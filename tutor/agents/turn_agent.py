@@ -0,0 +1,68 @@
+from pydantic_ai import Agent, RunContext
+from tutor.models.responses import TutorTurn
+from tutor.models.context import TutorContext
+from tutor.agents.base_agent import create_base_agent, BaseAgentConfig, get_conversation_context
+from tutor.agents.understanding_agent import UNDERSTANDING_SYSTEM_PROMPT
+from tutor.agents.feedback_agent import FEEDBACK_SYSTEM_PROMPT, get_mode_instructions
+from tutor.agents.instruction_agent import INSTRUCTION_SYSTEM_PROMPT, get_mode_specific_instructions
+
+TURN_SYSTEM_PROMPT = f"""
+You are a statistical tutor handling a single student message.
+Complete all three tasks below and return their results together.
+Base the feedback and the instructions on the understanding you determined in the first task.
+Always provide instructions; they are simply not shown if the student moves on.
+
+## UNDERSTANDING TASK
+{UNDERSTANDING_SYSTEM_PROMPT}
+## FEEDBACK TASK
+{FEEDBACK_SYSTEM_PROMPT}
+## INSTRUCTION TASK
+{INSTRUCTION_SYSTEM_PROMPT}
+"""
+
+# One call produces three outputs, so allow for a longer completion
+turn_agent = create_base_agent(
+    output_type=TutorTurn,
+    system_prompt=TURN_SYSTEM_PROMPT,
+    config=BaseAgentConfig(max_tokens=2000)
+)
+
+@turn_agent.system_prompt
+def get_turn_prompt(ctx: RunContext[TutorContext]) -> str:
+    """Dynamic system prompt based on current context and tutor mode"""
+    # Step-stable content first, per-turn values last (see get_understanding_prompt)
+    
+    feedback_instructions = get_mode_instructions(ctx.deps.tutor_mode)
+    instruction_instructions = get_mode_specific_instructions(ctx.deps.tutor_mode)
+    
+    return f"""
+    {feedback_instructions}
+    
+    {instruction_instructions}
+    
+    Current Context:
+    - Exercise: {ctx.deps.exercise.metadata.title}
+    - Checkpoint {ctx.deps.current_checkpoint}: {ctx.deps.current_main_question}
+    - Step {ctx.deps.current_step}: {ctx.deps.current_guiding_question}
+    - Tutor Mode: {ctx.deps.tutor_mode}
+    
+    Main Question and Full Answer:
+    {ctx.deps.current_main_question}
+    
+    Answer: {ctx.deps.current_main_answer}
+    
+    Current Guiding Question and Full Answer:
+    {ctx.deps.current_guiding_question}
+    
+    Answer: {ctx.deps.current_guiding_answer}
+    
+    IMPORTANT: Be generous! If the student shows ANY understanding of the concepts in the answers above, 
+    mark the corresponding question as answered.
+    
+    Iteration: {ctx.deps.iterations.step_interactions}/{ctx.deps.max_step_iterations}
+    
+    Previous Understanding:
+    {ctx.deps.current_understanding.summary_text}
+    """
+
+turn_agent.tool(get_conversation_context)
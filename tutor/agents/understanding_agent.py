@@ -30,14 +30,13 @@ understanding_agent = create_base_agent(
 @understanding_agent.system_prompt
 def get_understanding_prompt(ctx: RunContext[TutorContext]) -> str:
     """Dynamic system prompt based on current context"""
+    # Everything that only changes with the step comes first so the provider's
+    # prompt cache can reuse it; per-turn values go at the end
     return f"""
-    {UNDERSTANDING_SYSTEM_PROMPT}
-    
     Current Context:
     - Exercise: {ctx.deps.exercise.metadata.title}
     - Checkpoint {ctx.deps.current_checkpoint}: {ctx.deps.current_main_question}
     - Step {ctx.deps.current_step}: {ctx.deps.current_guiding_question}
-    - Iteration: {ctx.deps.iterations.step_interactions}/{ctx.deps.max_step_iterations}
     
     Current Guiding Question and Full Answer:
     {ctx.deps.current_guiding_question}
@@ -49,17 +48,17 @@ def get_understanding_prompt(ctx: RunContext[TutorContext]) -> str:
     
     Answer: {ctx.deps.current_main_answer}
     
-    Previous Understanding:
-    {ctx.deps.current_understanding.summary_text()}
-    
     IMPORTANT: Be generous! If the student shows ANY understanding of the concepts in the answers above, 
     mark the corresponding question as answered. Look for keywords, partial explanations, or even 
     questions that show they're thinking about the right concepts.
+    
+    Iteration: {ctx.deps.iterations.step_interactions}/{ctx.deps.max_step_iterations}
+    
+    Previous Understanding:
+    {ctx.deps.current_understanding.summary_text}
     """
 
 @understanding_agent.tool
 def get_reference_answer(ctx: RunContext[TutorContext]) -> str:
     """Tool to access reference answers for comparison"""
-    if ctx.deps.has_next_step():
-        return ctx.deps.current_guiding_answer
-    return ctx.deps.current_main_answer
\ No newline at end of file
+    return ctx.deps.reference_answer
\ No newline at end of file
@@ -1,12 +1,59 @@
 import os
+import io
 import json
+import time
+import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
 from openai import OpenAI
 from dotenv import load_dotenv
 
+# The strict schema helper behind responses.parse(text_format=...) lives in a
+# private SDK module (openai is pinned in requirements.txt); if an upgrade moves
+# it, fall back to pydantic's schema without strict mode
+try:
+    from openai.lib._pydantic import to_strict_json_schema
+except ImportError:
+    to_strict_json_schema = None
+
 from tutor.exercise_model import Exercise, ExerciseMetadata, Checkpoint, Step
 
+# Generation is streamed, so the read timeout only bounds the gap between events
+CLIENT_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+# Retries on connection errors, 429 and 5xx use the client's exponential backoff
+CLIENT_MAX_RETRIES = 5
+
+# Structured output format for Exercise, built once instead of on every request
+EXERCISE_TEXT_FORMAT = {
+    "type": "json_schema",
+    "name": "Exercise",
+    "schema": (to_strict_json_schema(Exercise) if to_strict_json_schema is not None
+               else Exercise.model_json_schema()),
+    "strict": to_strict_json_schema is not None
+}
+
+@lru_cache(maxsize=None)
+def _load_env_once() -> None:
+    """Load the .env file on first use only."""
+    load_dotenv()
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: Optional[str]) -> OpenAI:
+    """Get a shared OpenAI client per API key, so generators reuse its connection pool."""
+    return OpenAI(
+        api_key=api_key,
+        timeout=CLIENT_TIMEOUT,
+        max_retries=CLIENT_MAX_RETRIES
+    )
+
+@lru_cache(maxsize=64)
+def _read_markdown(path: Path, mtime_ns: int) -> str:
+    """Read a markdown reference file, memoized until the file changes."""
+    return path.read_bytes().decode('utf-8')
+
 class ExerciseGenerator:
     """
     A class for generating exercises using OpenAI's structured output capability.
@@ -37,8 +84,8 @@ class ExerciseGenerator:
             model: OpenAI model to use (default: "gpt-4.1")
         """
         # Load environment variables from .env file
-        load_dotenv()
-        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+        _load_env_once()
+        self.client = _get_client(api_key or os.getenv("OPENAI_API_KEY"))
         self.model = model
 
     def generate(self, prompt: str, markdown_file: Optional[str] = None) -> Exercise:
@@ -55,29 +102,163 @@ class ExerciseGenerator:
         messages = self._build_messages(prompt, markdown_file)
 
         try:
-            response = self.client.responses.parse(
+            with self.client.responses.stream(
                 model=self.model,
                 input=messages,
-                text_format=Exercise,
+                text={"format": EXERCISE_TEXT_FORMAT},
                 temperature=0.4
-            )
+            ) as stream:
+                for _ in stream:
+                    pass
+                response = stream.get_final_response()
 
-            return response.output_parsed
+            return Exercise.model_validate_json(response.output_text)
 
         except Exception as e:
             raise RuntimeError(f"Error generating exercise: {str(e)}")
 
+    def generate_many(
+        self,
+        prompts: List[str],
+        markdown_files: Optional[List[Optional[str]]] = None,
+        use_batch: bool = False,
+        max_concurrency: int = 4,
+        timeout: float = 24 * 60 * 60,
+        poll_interval: float = 30.0
+    ) -> List[Optional[Exercise]]:
+        """
+        Generate several exercises, concurrently or through the OpenAI Batch API.
+
+        Batches are billed at a discount but can take up to 24 hours to finish;
+        with use_batch=True this method blocks until the batch is done and
+        cancels it if it takes longer than the timeout.
+
+        Args:
+            prompts: The instructions for generating each exercise
+            markdown_files: Optional markdown file per prompt (same length as prompts)
+            use_batch: Submit all prompts as one Batch API job instead of direct requests
+            max_concurrency: Maximum number of direct requests in flight at once
+            timeout: Seconds to wait for a batch before cancelling it
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Exercises in prompt order, with None for prompts that failed
+
+        Raises:
+            TimeoutError: If the batch did not finish in time (it is cancelled)
+        """
+        markdown_files = markdown_files or [None] * len(prompts)
+        if len(markdown_files) != len(prompts):
+            raise ValueError("markdown_files must have one entry per prompt")
+
+        if not use_batch:
+            # Keep the number of parallel streams small to stay clear of rate limits
+            with ThreadPoolExecutor(max_workers=max(min(len(prompts), max_concurrency), 1)) as executor:
+                futures = [executor.submit(self.generate, prompt, markdown_file)
+                           for prompt, markdown_file in zip(prompts, markdown_files)]
+            results = []
+            for i, future in enumerate(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"Error generating exercise {i}: {e}")
+                    results.append(None)
+            return results
+
+        return self._generate_batch(prompts, markdown_files, timeout, poll_interval)
+
+    def _generate_batch(
+        self,
+        prompts: List[str],
+        markdown_files: List[Optional[str]],
+        timeout: float,
+        poll_interval: float
+    ) -> List[Optional[Exercise]]:
+        """Run the prompts as one Batch API job and collect its results."""
+        lines = [
+            orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": {
+                    "model": self.model,
+                    "input": self._build_messages(prompt, markdown_file),
+                    "text": {"format": EXERCISE_TEXT_FORMAT},
+                    "temperature": 0.4
+                }
+            })
+            for i, (prompt, markdown_file) in enumerate(zip(prompts, markdown_files))
+        ]
+
+        batch_file = self.client.files.create(
+            file=("exercises.jsonl", io.BytesIO(b"\n".join(lines))),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/responses",
+            completion_window="24h"
+        )
+        print(f"Submitted batch {batch.id} with {len(prompts)} prompts")
+
+        deadline = time.monotonic() + timeout
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                self.client.batches.cancel(batch.id)
+                raise TimeoutError(f"Batch {batch.id} did not finish within {timeout}s and was cancelled")
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        results: List[Optional[Exercise]] = [None] * len(prompts)
+        if not batch.output_file_id and not batch.error_file_id:
+            print(f"Batch {batch.id} finished with status {batch.status} and no output")
+            return results
+
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).read().splitlines():
+                if not line.strip():
+                    continue
+                entry = orjson.loads(line)
+                i = int(entry["custom_id"])
+                try:
+                    results[i] = self._parse_batch_entry(entry)
+                except Exception as e:
+                    print(f"Error generating exercise {i}: {e}")
+
+        return results
+
+    @staticmethod
+    def _parse_batch_entry(entry: Dict[str, Any]) -> Exercise:
+        """Extract the exercise from one line of a batch output or error file."""
+        response = entry.get("response") or {}
+        body = response.get("body") or {}
+        if entry.get("error") or body.get("error") or response.get("status_code", 200) != 200:
+            error = entry.get("error") or body.get("error") or {}
+            raise RuntimeError(
+                f"{error.get('code', response.get('status_code'))}: {error.get('message', 'request failed')}"
+            )
+
+        text = "".join(
+            content["text"]
+            for item in body["output"] if item.get("type") == "message"
+            for content in item["content"] if content.get("type") == "output_text"
+        )
+        return Exercise.model_validate_json(text)
+
     def _build_messages(self, prompt: str, markdown_file: Optional[str] = None) -> List[Dict[str, Any]]:
         """Build the message list for the API call, including markdown content if provided."""
         content = prompt
 
         if markdown_file:
             md_path = Path(markdown_file)
-            if not md_path.exists():
+            try:
+                mtime_ns = md_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Markdown file not found: {markdown_file}")
 
-            with open(md_path, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
+            markdown_content = _read_markdown(md_path, mtime_ns)
 
             content = f"{prompt}\n\nUse the following content as reference:\n\n{markdown_content}"
 
@@ -140,9 +321,6 @@ def save_exercise(exercise, base_filename=None, formats=None, exercise_dir=None)
     Returns:
         Dictionary of {format: filepath} for each successfully saved format
     """
-    import os
-    import json
-
     # Set defaults
     base_filename = base_filename or "exercise"
     formats = formats or ["json"]
@@ -162,15 +340,18 @@ def save_exercise(exercise, base_filename=None, formats=None, exercise_dir=None)
 
         try:
             if fmt.lower() == "json":
-                with open(filepath, "w", encoding="utf-8") as f:
-                    json.dump(exercise_data, f, indent=2)
+                with open(filepath, "wb") as f:
+                    f.write(orjson.dumps(exercise_data, option=orjson.OPT_INDENT_2))
                 saved_files["json"] = filepath
 
             elif fmt.lower() in ["yaml", "yml"]:
                 try:
                     import yaml
+                    # Use the libyaml emitter when available
+                    dumper = getattr(yaml, "CDumper", yaml.Dumper)
                     with open(filepath, "w", encoding="utf-8") as f:
-                        yaml.dump(exercise_data, f, sort_keys=False, indent=2)
+                        yaml.dump(exercise_data, f, Dumper=dumper, sort_keys=False,
+                                  indent=2, allow_unicode=True)
                     saved_files["yaml"] = filepath
                 except ImportError:
                     print("PyYAML is not installed. Skipping YAML output.")
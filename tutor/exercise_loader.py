@@ -1,11 +1,39 @@
 import yaml
 import json
+import orjson
 import os
+import sys
+import pickle
+import hashlib
+import tempfile
+from functools import lru_cache
 from typing import Dict, Any, List, Union
 from pathlib import Path
 
 from tutor.exercise_model import Exercise
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Parsed exercises are cached here, keyed by path, size and mtime
+CACHE_DIR = Path(tempfile.gettempdir()) / "grasp-exercises"
+
+# Bump when Exercise validation rules change without changing its schema, so
+# pickles validated under the old rules are no longer read
+CACHE_VERSION = 2
+
+# Cached pickles skip validation, so they are only valid for the model they
+# were written with
+MODEL_FINGERPRINT = hashlib.sha1(
+    orjson.dumps([CACHE_VERSION, Exercise.model_json_schema()], option=orjson.OPT_SORT_KEYS)
+).hexdigest()[:12]
+
+# Short metadata values that repeat across exercises and are worth interning
+INTERNED_METADATA_FIELDS = ("topic", "language", "level")
+
 class ExerciseLoader:
     """Utility class for loading Exercise objects from various sources.
 
@@ -37,13 +65,48 @@ class ExerciseLoader:
             raise ValueError(f"Unsupported file extension: {extension}. Use .yaml, .yml, or .json")
 
         # Then check if file exists
-        if not path.exists():
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Exercise file not found: {file_path}")
 
+        # Prefer a precompiled JSON sidecar (see tools/compile_exercises.py)
+        # as long as it is at least as new as the YAML source
         if extension in ('.yaml', '.yml'):
-            return ExerciseLoader.from_yaml(file_path)
+            json_path = str(path.with_suffix('.json'))
+            try:
+                json_stat = os.stat(json_path)
+            except OSError:
+                json_stat = None
+            if json_stat is not None and json_stat.st_mtime_ns >= stat.st_mtime_ns:
+                file_path, stat, extension = json_path, json_stat, '.json'
+
+        # Image paths are resolved against the path as given, so a relative path
+        # only identifies the loaded exercise together with the working directory
+        return ExerciseLoader._load_file(
+            file_path, os.getcwd(), extension, stat.st_size, stat.st_mtime_ns
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _load_file(file_path: str, cwd: str, extension: str, size: int, mtime_ns: int) -> Exercise:
+        """Load an exercise file, memoized per process on its size and mtime.
+
+        Exercises are frozen, so repeated loads of an unchanged file can share
+        one instance. On a miss, the on-disk cache is tried before parsing.
+        """
+        cache_path = ExerciseLoader._cache_path(file_path, cwd, size, mtime_ns)
+        cached = ExerciseLoader._read_cache(cache_path)
+        if cached is not None:
+            return cached
+
+        if extension in ('.yaml', '.yml'):
+            exercise = ExerciseLoader.from_yaml(file_path)
         else:  # Must be .json at this point
-            return ExerciseLoader.from_json(file_path)
+            exercise = ExerciseLoader.from_json(file_path)
+
+        ExerciseLoader._write_cache(cache_path, exercise)
+        return exercise
 
     @staticmethod
     def from_yaml(file_path: str) -> Exercise:
@@ -56,14 +119,14 @@ class ExerciseLoader:
             Exercise: A validated Exercise instance with adjusted paths
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = yaml.safe_load(file)
+            # PyYAML detects the encoding of bytes input itself
+            data = yaml.load(Path(file_path).read_bytes(), Loader=SafeLoader)
 
             # Get the exercise directory to adjust relative paths
             exercise_dir = os.path.dirname(file_path)
             data = ExerciseLoader._adjust_paths(data, exercise_dir)
 
-            return Exercise.model_validate(data)
+            return ExerciseLoader._validate(data)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in exercise file: {e}")
 
@@ -78,14 +141,13 @@ class ExerciseLoader:
             Exercise: A validated Exercise instance with adjusted paths
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            data = orjson.loads(Path(file_path).read_bytes())
 
             # Get the exercise directory to adjust relative paths
             exercise_dir = os.path.dirname(file_path)
             data = ExerciseLoader._adjust_paths(data, exercise_dir)
 
-            return Exercise.model_validate(data)
+            return ExerciseLoader._validate(data)
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in exercise file: {e}")
 
@@ -102,8 +164,76 @@ class ExerciseLoader:
         """
         if base_dir:
             data = ExerciseLoader._adjust_paths(data, base_dir)
+        return ExerciseLoader._validate(data)
+
+    @staticmethod
+    def _validate(data: Dict[str, Any]) -> Exercise:
+        """Validate exercise data, interning repeated metadata strings first.
+
+        Pydantic keeps the string objects it is given, so interning here lets
+        every loaded exercise share a single copy of e.g. the language code.
+        """
+        metadata = data.get("metadata") if isinstance(data, dict) else None
+        if isinstance(metadata, dict):
+            data = {**data, "metadata": {**metadata, **ExerciseLoader._interned_metadata(metadata)}}
         return Exercise.model_validate(data)
 
+    @staticmethod
+    def _interned_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Return interned copies of the repeated metadata values."""
+        interned = {}
+        for field in INTERNED_METADATA_FIELDS:
+            if isinstance(metadata.get(field), str):
+                interned[field] = sys.intern(metadata[field])
+        if isinstance(metadata.get("tags"), list):
+            interned["tags"] = [sys.intern(tag) if isinstance(tag, str) else tag
+                                for tag in metadata["tags"]]
+        return interned
+
+    @staticmethod
+    def _cache_path(file_path: str, cwd: str, size: int, mtime_ns: int) -> Path:
+        """Build the cache file path for an exercise file.
+
+        The key changes whenever the file is edited (size or mtime) or the
+        Exercise model changes, so stale entries are never read; they are simply
+        left behind in the temp directory. It uses the path exactly as given plus
+        the working directory, because the cached image paths are derived from it.
+        """
+        path_digest = hashlib.sha1(f"{cwd}\0{file_path}".encode("utf-8")).hexdigest()
+        return CACHE_DIR / f"{path_digest}-{size}-{mtime_ns}-{MODEL_FINGERPRINT}.pkl"
+
+    @staticmethod
+    def _read_cache(cache_path: Path) -> Union[Exercise, None]:
+        """Return the cached exercise, or None if there is no usable cache entry."""
+        try:
+            # Never unpickle from a shared temp directory owned by someone else
+            if hasattr(os, "getuid") and CACHE_DIR.stat().st_uid != os.getuid():
+                return None
+            with open(cache_path, 'rb') as file:
+                exercise = pickle.load(file)
+        except Exception:
+            return None
+        if not isinstance(exercise, Exercise):
+            return None
+        # Unpickled strings are fresh objects, so intern them again like _validate does
+        metadata = exercise.metadata
+        return exercise.model_copy(update={
+            "metadata": metadata.model_copy(update=ExerciseLoader._interned_metadata(dict(metadata)))
+        })
+
+    @staticmethod
+    def _write_cache(cache_path: Path, exercise: Exercise) -> None:
+        """Store a parsed exercise in the cache. Failures are ignored."""
+        try:
+            if not CACHE_DIR.is_dir():
+                CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as file:
+                pickle.dump(exercise, file, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
     @staticmethod
     def _adjust_paths(data: Dict[str, Any], base_dir: str) -> Dict[str, Any]:
         """Adjust all paths in the exercise data to be relative to the application root.
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict, ClassVar
 # Remove the date import and use string instead
 # from datetime import date
@@ -14,6 +14,8 @@ class DifficultyLevel(str, Enum):
     EXPERT = "expert"
 
 class Step(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     step_number: int = Field(..., description="Strictly sequential step number starting from 1")
     guiding_question: str = Field(..., description="A Markdown-formatted question, optionally with LaTeX math")
     guiding_answer: str = Field(..., description="Markdown-formatted answer, optionally with LaTeX")
@@ -40,6 +42,8 @@ class Step(BaseModel):
         return v
 
 class Checkpoint(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     checkpoint_number: int = Field(..., description="Sequential checkpoint number starting from 1")
     main_question: str = Field(..., description="The primary problem posed at this checkpoint")
     main_answer: str = Field(..., description="The answer or solution summary for the main question")
@@ -62,6 +66,8 @@ class Checkpoint(BaseModel):
         return steps
 
 class ExerciseMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Name of the exercise")
     topic: str = Field(..., description="Topic area, e.g., ANOVA, Regression")
     level: Optional[str] = Field(None, description="Intended difficulty level (e.g., beginner, advanced)")
@@ -73,10 +79,22 @@ class ExerciseMetadata(BaseModel):
     date_created: Optional[str] = Field(None, description="Optional creation date in YYYY-MM-DD format")
 
 class Exercise(BaseModel):
+    # Loaded exercises are shared by all sessions, so they must not be mutated
+    model_config = ConfigDict(frozen=True)
+
     metadata: ExerciseMetadata
     first_message: str = Field(..., description="Tutor's opening message to the student")
     end_message: str = Field(..., description="Final message shown after the last checkpoint")
     checkpoints: List[Checkpoint] = Field(..., description="Sequential learning checkpoints")
+
+    @field_validator('checkpoints')
+    @classmethod
+    def check_sequential_checkpoints(cls, checkpoints):
+        # TutorContext maps checkpoint numbers straight to list positions
+        for i, checkpoint in enumerate(checkpoints):
+            if checkpoint.checkpoint_number != i + 1:
+                raise ValueError("Checkpoints should be sequentially numbered starting from 1.")
+        return checkpoints
     
     @classmethod
     def create_example(cls) -> "Exercise":
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from tutor.exercise_model import Exercise
+from tutor.exercise_model import Exercise, Checkpoint, Step
 from tutor.models.state import IterationState, ProgressionState
 from tutor.models.responses import Understanding
 
@@ -24,10 +24,12 @@ class TutorContext(BaseModel):
     iterations: IterationState = Field(default_factory=IterationState)
     current_understanding: Understanding = Field(default_factory=Understanding.empty)
     conversation_history: List[Dict[str, Any]] = Field(default_factory=list)
+    conversation_length: int = 0  # All messages, including those trimmed from the history
     
     # Configuration
     max_step_iterations: int = 2
     max_checkpoint_iterations: int = 6
+    max_conversation_history: int = 50
     
     # Computed Properties
     @property
@@ -43,75 +45,99 @@ class TutorContext(BaseModel):
     @property
     def current_main_question(self) -> str:
         """Get the main question for current checkpoint"""
-        checkpoint_idx = self.current_checkpoint - 1
-        if 0 <= checkpoint_idx < len(self.exercise.checkpoints):
-            return self.exercise.checkpoints[checkpoint_idx].main_question
+        checkpoint = self._get_checkpoint()
+        if checkpoint is not None:
+            return checkpoint.main_question
         return "No more checkpoints available"
     
     @property
     def current_guiding_question(self) -> str:
         """Get the guiding question for current step"""
-        checkpoint_idx = self.current_checkpoint - 1
-        step_idx = self.current_step - 1
-        
-        if 0 <= checkpoint_idx < len(self.exercise.checkpoints):
-            checkpoint = self.exercise.checkpoints[checkpoint_idx]
-            if 0 <= step_idx < len(checkpoint.steps):
-                return checkpoint.steps[step_idx].guiding_question
-            else:
-                # No more steps, return main question
-                return checkpoint.main_question
-        return "No question available"
+        checkpoint = self._get_checkpoint()
+        if checkpoint is None:
+            return "No question available"
+        step = self._get_step(checkpoint)
+        if step is not None:
+            return step.guiding_question
+        # No more steps, return main question
+        return checkpoint.main_question
     
     @property
     def current_main_answer(self) -> str:
         """Get the main answer for current checkpoint"""
-        checkpoint_idx = self.current_checkpoint - 1
-        if 0 <= checkpoint_idx < len(self.exercise.checkpoints):
-            return self.exercise.checkpoints[checkpoint_idx].main_answer
+        checkpoint = self._get_checkpoint()
+        if checkpoint is not None:
+            return checkpoint.main_answer
         return ""
     
     @property
     def current_guiding_answer(self) -> str:
         """Get the guiding answer for current step"""
-        checkpoint_idx = self.current_checkpoint - 1
-        step_idx = self.current_step - 1
-        
-        if 0 <= checkpoint_idx < len(self.exercise.checkpoints):
-            checkpoint = self.exercise.checkpoints[checkpoint_idx]
-            if 0 <= step_idx < len(checkpoint.steps):
-                return checkpoint.steps[step_idx].guiding_answer
+        step = self._get_step(self._get_checkpoint())
+        if step is not None:
+            return step.guiding_answer
         return ""
     
+    @property
+    def reference_answer(self) -> str:
+        """Get the answer to the question currently being worked on: the
+        guiding answer while there are steps left, otherwise the main answer"""
+        checkpoint = self._get_checkpoint()
+        if checkpoint is None:
+            return ""
+        step = self._get_step(checkpoint)
+        if step is not None:
+            return step.guiding_answer
+        return checkpoint.main_answer
+    
     @property
     def current_image_path(self) -> Optional[str]:
         """Get image path for current step"""
-        checkpoint_idx = self.current_checkpoint - 1
-        step_idx = self.current_step - 1
-        
-        if 0 <= checkpoint_idx < len(self.exercise.checkpoints):
-            checkpoint = self.exercise.checkpoints[checkpoint_idx]
-            if 0 <= step_idx < len(checkpoint.steps):
-                return checkpoint.steps[step_idx].image
+        step = self._get_step(self._get_checkpoint())
+        if step is not None:
+            return step.image
         return None
     
     @property
     def current_solution_image_path(self) -> Optional[str]:
         """Get solution image path for current checkpoint"""
-        checkpoint_idx = self.current_checkpoint - 1
-        if 0 <= checkpoint_idx < len(self.exercise.checkpoints):
-            return self.exercise.checkpoints[checkpoint_idx].image_solution
+        checkpoint = self._get_checkpoint()
+        if checkpoint is not None:
+            return checkpoint.image_solution
+        return None
+    
+    def _get_checkpoint(self) -> Optional[Checkpoint]:
+        """Get the current checkpoint, or None if past the last one"""
+        checkpoints = self.exercise.checkpoints
+        checkpoint_idx = self.progression.current_checkpoint - 1
+        if 0 <= checkpoint_idx < len(checkpoints):
+            return checkpoints[checkpoint_idx]
+        return None
+    
+    def _get_step(self, checkpoint: Optional[Checkpoint]) -> Optional[Step]:
+        """Get the current step of a checkpoint, or None if past the last one"""
+        if checkpoint is None:
+            return None
+        step_idx = self.progression.current_step - 1
+        if 0 <= step_idx < len(checkpoint.steps):
+            return checkpoint.steps[step_idx]
         return None
     
     def add_to_conversation(self, role: str, content: str):
-        """Add message to conversation history"""
-        self.conversation_history.append({
+        """Add message to conversation history, keeping only the most recent messages"""
+        history = self.conversation_history
+        self.conversation_length += 1
+        history.append({
             "role": role,
             "content": content,
             "timestamp": datetime.utcnow().isoformat(),
             "checkpoint": self.current_checkpoint,
             "step": self.current_step
         })
+        # The agents only look at the last few messages; the full transcript
+        # is kept in the UI session state
+        if len(history) > self.max_conversation_history:
+            del history[:-self.max_conversation_history]
     
     def advance_step(self):
         """Advance to next step and reset step iterations"""
@@ -137,9 +163,8 @@ class TutorContext(BaseModel):
     
     def has_next_step(self) -> bool:
         """Check if there's another step in current checkpoint"""
-        checkpoint_idx = self.current_checkpoint - 1
-        if 0 <= checkpoint_idx < len(self.exercise.checkpoints):
-            checkpoint = self.exercise.checkpoints[checkpoint_idx]
+        checkpoint = self._get_checkpoint()
+        if checkpoint is not None:
             return self.current_step <= len(checkpoint.steps)
         return False
     
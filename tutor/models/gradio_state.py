@@ -52,12 +52,13 @@ class GradioSessionState(BaseModel):
     
     def add_chat_message(self, role: str, content: str):
         """Add message to chat history"""
+        context = self.tutor_context
         message = {
             "role": role,
             "content": content,
             "timestamp": datetime.utcnow().isoformat(),
-            "checkpoint": self.tutor_context.current_checkpoint if self.tutor_context else 1,
-            "step": self.tutor_context.current_step if self.tutor_context else 1
+            "checkpoint": context.current_checkpoint if context else 1,
+            "step": context.current_step if context else 1
         }
         self.chat_history.append(message)
         self.update_activity()
@@ -74,16 +75,18 @@ class GradioSessionState(BaseModel):
     
     def get_session_summary(self) -> Dict[str, Any]:
         """Get summary of current session"""
+        context = self.tutor_context
+        settings = self.settings
         return {
             "session_id": self.session_id,
             "user_id": self.user_id,
-            "exercise": self.settings.get('exercise_name', 'unknown'),
-            "tutor_mode": self.settings.get('tutor_mode', 'unknown'),
-            "current_checkpoint": self.tutor_context.current_checkpoint if self.tutor_context else 0,
-            "current_step": self.tutor_context.current_step if self.tutor_context else 0,
+            "exercise": settings.get('exercise_name', 'unknown'),
+            "tutor_mode": settings.get('tutor_mode', 'unknown'),
+            "current_checkpoint": context.current_checkpoint if context else 0,
+            "current_step": context.current_step if context else 0,
             "total_messages": len(self.chat_history),
             "session_duration_minutes": (self.last_activity - self.created_at).total_seconds() / 60,
-            "exercise_complete": self.tutor_context.is_exercise_complete() if self.tutor_context else False
+            "exercise_complete": context.is_exercise_complete() if context else False
         }
     
     class Config:
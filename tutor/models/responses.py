@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 
 class Understanding(BaseModel):
     """Response model for understanding evaluation by PydanticAI agent"""
+    model_config = ConfigDict(frozen=True)
+
     main_question_answered: bool = False
     guiding_question_answered: bool = False
     confidence_score: float = Field(ge=0.0, le=1.0, default=0.5)
@@ -14,23 +16,26 @@ class Understanding(BaseModel):
     
     @classmethod
     def empty(cls) -> "Understanding":
-        """Create empty understanding state"""
-        return cls(
-            main_question_answered=False,
-            guiding_question_answered=False,
-            confidence_score=0.5,
-            identified_concepts=[],
-            misconceptions=[],
-            summary=[],
-            reasoning=""
-        )
+        """Get the shared empty understanding state (immutable, so safe to share)"""
+        return _EMPTY_UNDERSTANDING
     
+    @property
     def summary_text(self) -> str:
-        """Get formatted summary text"""
+        """Formatted summary text"""
         if not self.summary:
             return "No previous understanding recorded."
         return "\n".join(f"- {item}" for item in self.summary)
 
+_EMPTY_UNDERSTANDING = Understanding(
+    main_question_answered=False,
+    guiding_question_answered=False,
+    confidence_score=0.5,
+    identified_concepts=[],
+    misconceptions=[],
+    summary=[],
+    reasoning=""
+)
+
 class Feedback(BaseModel):
     """Response model for feedback generation by PydanticAI agent"""
     feedback: str
@@ -67,6 +72,12 @@ class Instructions(BaseModel):
             reasoning=""
         )
 
+class TutorTurn(BaseModel):
+    """Combined response model for evaluating a whole student turn in one agent call"""
+    understanding: Understanding
+    feedback: Feedback
+    instructions: Optional[Instructions] = None
+
 class TutorResponse(BaseModel):
     """Comprehensive response from tutor coordinator"""
     feedback_text: str
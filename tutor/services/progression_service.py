@@ -1,7 +1,15 @@
+import logging
 from typing import Optional
 from tutor.models.context import TutorContext
 from tutor.models.responses import Understanding, TutorResponse
 
+logger = logging.getLogger(__name__)
+
+# Transition phrases, indexed by whether this is the first step of a checkpoint
+FIRST_STEP_INTRO = "\n\nLass uns zuerst über diese Frage nachdenken:\n"
+STEP_INTROS = (FIRST_STEP_INTRO, "\n\nLass uns jetzt über diese Frage nachdenken:\n")
+MAIN_QUESTION_INTRO = "Lass uns nun wieder über die eigentliche Frage nachdenken:\n"
+
 class ProgressionService:
     """Handles progression logic through exercises"""
     
@@ -22,15 +30,18 @@ class ProgressionService:
         iterations = context.iterations
         
         # Debug information
-        print(f"\n=== PROGRESSION DEBUG ===")
-        print(f"Main question answered: {understanding.main_question_answered}")
-        print(f"Guiding question answered: {understanding.guiding_question_answered}")
-        print(f"Step iterations: {iterations.step_interactions}/{context.max_step_iterations}")
-        print(f"Checkpoint iterations: {iterations.checkpoint_interactions}/{context.max_checkpoint_iterations}")
-        print(f"Has step iterations left: {iterations.has_step_iterations_left(context.max_step_iterations)}")
-        print(f"Has checkpoint iterations left: {iterations.has_checkpoint_iterations_left(context.max_checkpoint_iterations)}")
-        print(f"Has next step: {self._has_next_step(context)}")
-        print(f"Has next checkpoint: {self._has_next_checkpoint(context)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Progression: main answered=%s, guiding answered=%s, "
+                "step iterations=%s/%s, checkpoint iterations=%s/%s, "
+                "has next step=%s, has next checkpoint=%s",
+                understanding.main_question_answered,
+                understanding.guiding_question_answered,
+                iterations.step_interactions, context.max_step_iterations,
+                iterations.checkpoint_interactions, context.max_checkpoint_iterations,
+                self._has_next_step(context),
+                self._has_next_checkpoint(context),
+            )
         
         # Check if main question is answered or checkpoint limit reached
         if (understanding.main_question_answered or 
@@ -38,13 +49,11 @@ class ProgressionService:
             
             if self._has_next_checkpoint(context):
                 action = "advance_checkpoint"
-                print(f"Action: {action} (main question answered or checkpoint limit reached)")
-                print("==========================\n")
+                logger.debug("Action: %s (main question answered or checkpoint limit reached)", action)
                 return action
             else:
                 action = "finish"
-                print(f"Action: {action} (no more checkpoints)")
-                print("==========================\n")
+                logger.debug("Action: %s (no more checkpoints)", action)
                 return action
         
         # Check if guiding question is answered or step limit reached
@@ -53,20 +62,17 @@ class ProgressionService:
             
             if self._has_next_step(context):
                 action = "advance_step"
-                print(f"Action: {action} (guiding question answered or step limit reached)")
-                print("==========================\n")
+                logger.debug("Action: %s (guiding question answered or step limit reached)", action)
                 return action
             else:
                 # No more steps, continue with main question
                 action = "continue_question"
-                print(f"Action: {action} (no more steps, continue with main question)")
-                print("==========================\n")
+                logger.debug("Action: %s (no more steps, continue with main question)", action)
                 return action
         
         else:
             action = "continue_question"
-            print(f"Action: {action} (default - continue working on current question)")
-            print("==========================\n")
+            logger.debug("Action: %s (default - continue working on current question)", action)
             return action
     
     def get_next_step_content(self, context: TutorContext) -> dict:
@@ -99,9 +105,12 @@ class ProgressionService:
     def get_next_checkpoint_content(self, context: TutorContext) -> Optional[dict]:
         """Get content for the next checkpoint"""
         next_checkpoint_idx = context.current_checkpoint  # will be incremented
-        
-        if next_checkpoint_idx < len(context.exercise.checkpoints):
-            checkpoint = context.exercise.checkpoints[next_checkpoint_idx]
+        return self.get_checkpoint_content(context, next_checkpoint_idx)
+    
+    def get_checkpoint_content(self, context: TutorContext, checkpoint_idx: int) -> Optional[dict]:
+        """Get content for the checkpoint at the given 0-based index"""
+        if 0 <= checkpoint_idx < len(context.exercise.checkpoints):
+            checkpoint = context.exercise.checkpoints[checkpoint_idx]
             first_step = checkpoint.steps[0] if checkpoint.steps else None
             
             return {
@@ -110,7 +119,7 @@ class ProgressionService:
                 "first_guiding_question": first_step.guiding_question if first_step else None,
                 "first_image_path": first_step.image if first_step else None,
                 "solution_image_path": checkpoint.image_solution,
-                "checkpoint_number": next_checkpoint_idx + 1
+                "checkpoint_number": checkpoint_idx + 1
             }
         
         return None
@@ -130,38 +139,34 @@ class ProgressionService:
     def format_step_transition_message(self, context: TutorContext, step_content: dict) -> str:
         """Format message for step transition"""
         if step_content["type"] == "guiding_question":
-            transition_word = "zuerst" if context.current_step == 1 else "jetzt"
-            return f"\n\nLass uns {transition_word} über diese Frage nachdenken:\n{step_content['question']}"
+            return f"{STEP_INTROS[0 if context.current_step == 1 else 1]}{step_content['question']}"
         else:
-            return f"Lass uns nun wieder über die eigentliche Frage nachdenken:\n{step_content['question']}"
+            return f"{MAIN_QUESTION_INTRO}{step_content['question']}"
     
     def format_checkpoint_transition_message(self, context: TutorContext, checkpoint_content: dict) -> str:
         """Format message for checkpoint transition"""
-        message = f"Die Hauptfrage ist:\n{checkpoint_content['main_question']}\n\n"
+        main_question = checkpoint_content['main_question']
         
         if checkpoint_content["first_guiding_question"]:
-            message += f"\n\nLass uns zuerst über diese Frage nachdenken:\n{checkpoint_content['first_guiding_question']}"
+            follow_up = f"{FIRST_STEP_INTRO}{checkpoint_content['first_guiding_question']}"
         else:
-            message += "Lass uns nun wieder über die eigentliche Frage nachdenken:\n"
-            message += checkpoint_content['main_question']
+            follow_up = f"{MAIN_QUESTION_INTRO}{main_question}"
         
-        return message
+        return f"Die Hauptfrage ist:\n{main_question}\n\n{follow_up}"
     
     def format_solution_message(self, understanding: Understanding, context: TutorContext) -> str:
         """Format solution reveal message"""
-        message = ""
-        
         if understanding.main_question_answered:
-            message += "\nDu hast die **zentrale Frage** richtig beantwortet!\n\n"
+            praise = "\nDu hast die **zentrale Frage** richtig beantwortet!\n\n"
         elif understanding.guiding_question_answered:
-            message += "\nDu hast die Frage richtig beantwortet!\n\n"
+            praise = "\nDu hast die Frage richtig beantwortet!\n\n"
+        else:
+            praise = ""
         
         # Get appropriate answer
         if understanding.guiding_question_answered and not understanding.main_question_answered:
-            message += "Hier ist die Musterantwort dieser Frage: \n"
-            message += context.current_guiding_answer
+            answer = f"Hier ist die Musterantwort dieser Frage: \n{context.current_guiding_answer}"
         else:
-            message += "Hier ist die Musterantwort der zentralen Frage: \n"
-            message += context.current_main_answer
+            answer = f"Hier ist die Musterantwort der zentralen Frage: \n{context.current_main_answer}"
         
-        return message
\ No newline at end of file
+        return f"{praise}{answer}"
\ No newline at end of file
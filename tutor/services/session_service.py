@@ -17,7 +17,6 @@ class SessionService:
     """
     
     def __init__(self):
-        self.exercise_loader = ExerciseLoader()
         self.tutor_coordinator = TutorCoordinator()
     
     async def create_session(
@@ -28,9 +27,9 @@ class SessionService:
     ) -> TutorContext:
         """Create a new tutoring session"""
         
-        # Load exercise
-        exercise_path = f"exercises/{exercise_name}/exercise.yaml"
-        exercise = self.exercise_loader.load(exercise_path)
+        # Load exercise. ExerciseLoader memoizes unchanged files, so sessions
+        # share one frozen instance until the file is edited
+        exercise = ExerciseLoader.load(f"exercises/{exercise_name}/exercise.yaml")
         
         # Create progression state
         progression = ProgressionState(
@@ -129,5 +128,5 @@ Lass uns zuerst über diese Frage nachdenken:
             "current_step": context.current_step,
             "total_interactions": context.iterations.total_interactions,
             "exercise_complete": context.is_exercise_complete(),
-            "conversation_length": len(context.conversation_history)
+            "conversation_length": context.conversation_length
         }
\ No newline at end of file
@@ -1,8 +1,19 @@
+import os
+import asyncio
+import logging
 from typing import Optional
-from tutor.agents import understanding_agent, feedback_agent, instruction_agent
+from tutor.agents import understanding_agent, feedback_agent, instruction_agent, turn_agent
 from tutor.models.context import TutorContext
-from tutor.models.responses import TutorResponse, Understanding, Feedback, Instructions
+from tutor.models.responses import TutorResponse, Understanding, Feedback, Instructions, TutorTurn
 from tutor.services.progression_service import ProgressionService
+from tutor.services.understanding_cache import UnderstandingCache
+
+logger = logging.getLogger(__name__)
+
+# Caps the agent calls in flight across all sessions. All Gradio handlers run
+# on the server event loop, so one module-level semaphore covers every turn.
+# Rate-limit responses are retried with backoff by the OpenAI client itself.
+_AGENT_SEMAPHORE = asyncio.Semaphore(int(os.getenv("TUTOR_MAX_CONCURRENT", "10")))
 
 class TutorCoordinator:
     """Orchestrates the multi-agent tutoring workflow"""
@@ -11,7 +22,16 @@ class TutorCoordinator:
         self.understanding_agent = understanding_agent
         self.feedback_agent = feedback_agent
         self.instruction_agent = instruction_agent
+        self.turn_agent = turn_agent
         self.progression_service = ProgressionService()
+        # Evaluate each turn with one combined agent call instead of up to three
+        self.single_call = os.getenv("TUTOR_SINGLE_CALL", "false").lower() in ("1", "true", "yes")
+        # Reuse evaluations of repeated answers (off by default: skews research data)
+        self.understanding_cache = (
+            UnderstandingCache()
+            if os.getenv("TUTOR_UNDERSTANDING_CACHE", "false").lower() in ("1", "true", "yes")
+            else None
+        )
     
     async def process_student_input(
         self,
@@ -27,21 +47,40 @@ class TutorCoordinator:
             context.add_to_conversation("user", message)
             context.iterations.increment()
             
-            # Phase 1: Evaluate Understanding
-            understanding = await self._evaluate_understanding(message, context)
-            context.current_understanding = understanding
-            
-            # Phase 2: Generate Feedback
-            feedback = await self._generate_feedback(message, context)
-            
-            # Phase 3: Determine Progression
-            progression_action = self.progression_service.determine_next_action(
-                understanding, context
-            )
+            if self.single_call:
+                # Phases 1 and 3 (understanding + feedback/instructions) in a single agent call
+                turn = await self._evaluate_turn(message, context)
+                understanding, feedback, instructions = turn.understanding, turn.feedback, turn.instructions
+                context.current_understanding = understanding
+                
+                # Phase 2: Determine Progression
+                progression_action = self.progression_service.determine_next_action(
+                    understanding, context
+                )
+            else:
+                # Phase 1: Evaluate Understanding
+                understanding = await self._evaluate_understanding(message, context)
+                context.current_understanding = understanding
+                
+                # Phase 2: Determine Progression
+                progression_action = self.progression_service.determine_next_action(
+                    understanding, context
+                )
+                
+                # Phase 3: Generate Feedback (and Instructions when staying on the question).
+                # Both agents only read the updated understanding, so run them concurrently.
+                if progression_action == "continue_question":
+                    feedback, instructions = await asyncio.gather(
+                        self._generate_feedback(message, context),
+                        self._generate_instructions(message, context)
+                    )
+                else:
+                    feedback = await self._generate_feedback(message, context)
+                    instructions = None
             
             # Phase 4: Generate Response Based on Action
             response = await self._create_response(
-                feedback, understanding, progression_action, message, context
+                feedback, understanding, progression_action, instructions, context
             )
             
             # Add assistant response to conversation history
@@ -52,32 +91,76 @@ class TutorCoordinator:
         except Exception as e:
             return self._create_error_response(str(e), context)
     
+    async def _run_agent(self, agent, message: str, context: TutorContext):
+        """Run an agent, waiting for a free slot when too many calls are in flight"""
+        async with _AGENT_SEMAPHORE:
+            return await agent.run(message, deps=context)
+    
     async def _evaluate_understanding(
         self, 
         message: str, 
         context: TutorContext
     ) -> Understanding:
         """Evaluate student understanding using PydanticAI agent"""
+        if self.understanding_cache is not None:
+            understanding = self.understanding_cache.get(message, context)
+            if understanding is not None:
+                logger.debug("Understanding cache hit for %r", message)
+                return understanding
+        
         try:
-            result = await self.understanding_agent.run(message, deps=context)
+            result = await self._run_agent(self.understanding_agent, message, context)
             understanding = result.data
-            
-            # Debug information
-            print(f"\n=== UNDERSTANDING DEBUG ===")
-            print(f"Student message: '{message}'")
-            print(f"Current guiding question: '{context.current_guiding_question}'")
-            print(f"Guiding question answered: {understanding.guiding_question_answered}")
-            print(f"Main question answered: {understanding.main_question_answered}")
-            print(f"Confidence score: {understanding.confidence_score}")
-            print(f"Step iterations: {context.iterations.step_interactions}/{context.max_step_iterations}")
-            print(f"Checkpoint iterations: {context.iterations.checkpoint_interactions}/{context.max_checkpoint_iterations}")
-            print("===========================\n")
-            
+            self._log_understanding(message, understanding, context)
+            if self.understanding_cache is not None:
+                self.understanding_cache.put(message, context, understanding)
             return understanding
-        except Exception as e:
-            print(f"Error in understanding evaluation: {e}")
+        except Exception:
+            logger.exception("Error in understanding evaluation")
             return Understanding.empty()
     
+    async def _evaluate_turn(
+        self,
+        message: str,
+        context: TutorContext
+    ) -> TutorTurn:
+        """Evaluate understanding and generate feedback and instructions in one agent call"""
+        try:
+            result = await self._run_agent(self.turn_agent, message, context)
+            turn = result.data
+            self._log_understanding(message, turn.understanding, context)
+            if turn.instructions is None:
+                turn = turn.model_copy(update={"instructions": Instructions.empty()})
+            return turn
+        except Exception:
+            logger.exception("Error in combined turn evaluation")
+            return TutorTurn(
+                understanding=Understanding.empty(),
+                feedback=Feedback.empty(),
+                instructions=Instructions.empty()
+            )
+    
+    def _log_understanding(
+        self,
+        message: str,
+        understanding: Understanding,
+        context: TutorContext
+    ) -> None:
+        """Log the evaluated understanding at debug level"""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Understanding: message=%r, guiding question=%r, guiding answered=%s, "
+                "main answered=%s, confidence=%s, step iterations=%s/%s, "
+                "checkpoint iterations=%s/%s",
+                message,
+                context.current_guiding_question,
+                understanding.guiding_question_answered,
+                understanding.main_question_answered,
+                understanding.confidence_score,
+                context.iterations.step_interactions, context.max_step_iterations,
+                context.iterations.checkpoint_interactions, context.max_checkpoint_iterations,
+            )
+    
     async def _generate_feedback(
         self, 
         message: str, 
@@ -85,10 +168,10 @@ class TutorCoordinator:
     ) -> Feedback:
         """Generate constructive feedback using PydanticAI agent"""
         try:
-            result = await self.feedback_agent.run(message, deps=context)
+            result = await self._run_agent(self.feedback_agent, message, context)
             return result.data
-        except Exception as e:
-            print(f"Error in feedback generation: {e}")
+        except Exception:
+            logger.exception("Error in feedback generation")
             return Feedback.empty()
     
     async def _create_response(
@@ -96,15 +179,12 @@ class TutorCoordinator:
         feedback: Feedback,
         understanding: Understanding,
         action: str,
-        message: str,
+        instructions: Optional[Instructions],
         context: TutorContext
     ) -> TutorResponse:
         """Create the final response based on determined action"""
         
         if action == "continue_question":
-            # Generate instructions for continuing with current question
-            instructions = await self._generate_instructions(message, context)
-            
             return TutorResponse(
                 feedback_text=feedback.feedback,
                 instruction_text=instructions.instructions,
@@ -125,7 +205,7 @@ class TutorCoordinator:
             step_message = self.progression_service.format_step_transition_message(context, next_step_content)
             
             return TutorResponse(
-                feedback_text=feedback.feedback + "\n\n" + solution_text + step_message,
+                feedback_text=f"{feedback.feedback}\n\n{solution_text}{step_message}",
                 solution_text=context.current_guiding_answer,
                 next_question=next_step_content.get("question"),
                 image_path=next_step_content.get("image_path"),
@@ -152,9 +232,9 @@ class TutorCoordinator:
                 )
                 
                 full_message = (
-                    feedback.feedback + "\n\n" + solution_text + 
-                    "\n\nLass uns mit der nächsten Aufgabe fortfahren.\n" + 
-                    checkpoint_message
+                    f"{feedback.feedback}\n\n{solution_text}"
+                    "\n\nLass uns mit der nächsten Aufgabe fortfahren.\n"
+                    f"{checkpoint_message}"
                 )
                 
                 return TutorResponse(
@@ -171,7 +251,7 @@ class TutorCoordinator:
                 # Exercise complete
                 context.iterations.finished = True
                 return TutorResponse(
-                    feedback_text=feedback.feedback + "\n\n" + solution_text,
+                    feedback_text=f"{feedback.feedback}\n\n{solution_text}",
                     action="finish",
                     completion_message=context.exercise.end_message,
                     next_checkpoint=context.current_checkpoint,
@@ -195,10 +275,10 @@ class TutorCoordinator:
     ) -> Instructions:
         """Generate instructions using PydanticAI agent"""
         try:
-            result = await self.instruction_agent.run(message, deps=context)
+            result = await self._run_agent(self.instruction_agent, message, context)
             return result.data
-        except Exception as e:
-            print(f"Error in instruction generation: {e}")
+        except Exception:
+            logger.exception("Error in instruction generation")
             return Instructions.empty()
     
     def _create_error_response(self, error_message: str, context: TutorContext) -> TutorResponse:
@@ -227,27 +307,20 @@ class TutorCoordinator:
             # Jump to checkpoint
             context.jump_to_checkpoint(checkpoint_num)
             
-            # Get content for the new checkpoint
-            checkpoint = context.exercise.checkpoints[checkpoint_num - 1]
-            first_step = checkpoint.steps[0] if checkpoint.steps else None
-            
-            message_text = f"Jumped to Checkpoint {checkpoint_num}\n\n"
-            message_text += f"Die Hauptfrage ist:\n{checkpoint.main_question}\n\n"
-            
-            if first_step:
-                message_text += f"\n\nLass uns zuerst über diese Frage nachdenken:\n{first_step.guiding_question}"
-                image_path = first_step.image
-            else:
-                message_text += "Lass uns nun wieder über die eigentliche Frage nachdenken:\n"
-                message_text += checkpoint.main_question
-                image_path = None
+            # Present the new checkpoint the same way as a regular transition
+            checkpoint_content = self.progression_service.get_checkpoint_content(
+                context, checkpoint_num - 1
+            )
+            checkpoint_message = self.progression_service.format_checkpoint_transition_message(
+                context, checkpoint_content
+            )
             
             return TutorResponse(
-                feedback_text=message_text,
+                feedback_text=f"Jumped to Checkpoint {checkpoint_num}\n\n{checkpoint_message}",
                 action="continue_question",
                 next_checkpoint=context.current_checkpoint,
                 next_step=context.current_step,
-                image_path=image_path
+                image_path=checkpoint_content["first_image_path"]
             )
             
         except Exception as e:
@@ -0,0 +1,61 @@
+import re
+from collections import OrderedDict
+from typing import Optional, Tuple
+from tutor.models.context import TutorContext
+from tutor.models.responses import Understanding
+
+# Number of evaluated understandings kept for repeated student answers
+UNDERSTANDING_CACHE_SIZE = 4096
+
+_WHITESPACE = re.compile(r"\s+")
+# Only sentence punctuation at the very end; operators, signs and decimal
+# points change the meaning of a statistical answer and must stay
+_TRAILING_PUNCTUATION = re.compile(r"[.!?,;:]+$")
+
+def normalize_answer(message: str) -> str:
+    """Normalize a student answer for exact-match caching"""
+    text = _WHITESPACE.sub(" ", message.lower()).strip()
+    return _TRAILING_PUNCTUATION.sub("", text).rstrip()
+
+class UnderstandingCache:
+    """
+    Exact-match LRU cache of understanding evaluations.
+
+    Entries are keyed on the exercise position, the answered flags of the
+    previous understanding and the normalized answer. Opt-in only (see
+    TUTOR_UNDERSTANDING_CACHE): replayed evaluations skew tutoring research data.
+    """
+
+    def __init__(self, maxsize: int = UNDERSTANDING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, Understanding]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(message: str, context: TutorContext) -> Tuple:
+        """Cache key for an answer at the current step"""
+        previous = context.current_understanding
+        return (
+            context.progression.exercise_id,
+            context.current_checkpoint,
+            context.current_step,
+            previous.guiding_question_answered,
+            previous.main_question_answered,
+            normalize_answer(message),
+        )
+
+    def get(self, message: str, context: TutorContext) -> Optional[Understanding]:
+        """Get the cached understanding for an answer, or None"""
+        key = self.key(message, context)
+        understanding = self._entries.get(key)
+        if understanding is not None:
+            self._entries.move_to_end(key)
+        return understanding
+
+    def put(self, message: str, context: TutorContext, understanding: Understanding) -> None:
+        """Store an evaluated understanding, evicting the least recently used entry"""
+        self._entries[self.key(message, context)] = understanding
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -155,7 +155,7 @@ class ChatTab:
             
             return history, "", state
     
-    def handle_goto(
+    async def handle_goto(
         self, 
         checkpoint_num: int, 
         state: GradioSessionState
@@ -170,10 +170,7 @@ class ChatTab:
             goto_command = f"/goto {int(checkpoint_num)}"
             
             # Process through bridge
-            import asyncio
-            response_text, _, updated_state = asyncio.run(
-                self.bridge.process_chat_message(goto_command, state)
-            )
+            response_text, _, updated_state = await self.bridge.process_chat_message(goto_command, state)
             
             # Update history
             updated_history = self.bridge.format_chat_history(updated_state)
@@ -1,6 +1,5 @@
 import gradio as gr
 import os
-import asyncio
 from typing import Dict, Any, Tuple, List
 from dotenv import load_dotenv
 from tutor.ui.gradio_bridge import GradioTutorBridge
@@ -189,13 +188,13 @@ class TutorApp:
             ]
         )
     
-    async def _initialize_session_async(
+    async def _initialize_session(
         self,
         exercise_name: str,
         tutor_mode: str,
         state: GradioSessionState
     ) -> Tuple[str, List[Dict], str, str, str, float, str, GradioSessionState]:
-        """Async session initialization"""
+        """Initialize new tutoring session"""
         try:
             welcome_text, updated_state = await self.bridge.initialize_session(
                 exercise_name=exercise_name,
@@ -222,16 +221,7 @@ class TutorApp:
             error_status = f"**Status:** Fehler beim Starten der Session: {str(e)}"
             return error_status, [], "## Fehler", "**Checkpoint:** --", "**Schritt:** --", 0, "**Frage:** Fehler", state
     
-    def _initialize_session(
-        self,
-        exercise_name: str,
-        tutor_mode: str,
-        state: GradioSessionState
-    ) -> Tuple[str, List[Dict], str, str, str, float, str, GradioSessionState]:
-        """Initialize new tutoring session"""
-        return asyncio.run(self._initialize_session_async(exercise_name, tutor_mode, state))
-    
-    def _handle_chat_message(
+    async def _handle_chat_message(
         self,
         message: str,
         history: List[Dict],
@@ -241,15 +231,15 @@ class TutorApp:
         if not message.strip():
             return history, message, state
         
-        return asyncio.run(self.chat_tab.handle_message(message, history, state))
+        return await self.chat_tab.handle_message(message, history, state)
     
-    def _handle_goto(
+    async def _handle_goto(
         self,
         checkpoint_num: int,
         state: GradioSessionState
     ) -> Tuple[List[Dict], GradioSessionState]:
         """Handle goto command"""
-        return self.chat_tab.handle_goto(checkpoint_num, state)
+        return await self.chat_tab.handle_goto(checkpoint_num, state)
     
     def _clear_chat(
         self,
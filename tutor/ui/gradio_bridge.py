@@ -113,15 +113,11 @@ class GradioTutorBridge:
     
     def format_chat_history(self, gradio_state: GradioSessionState) -> list:
         """Format chat history for Gradio chatbot component"""
-        formatted_history = []
-        
-        for msg in gradio_state.chat_history:
-            if msg["role"] == "user":
-                formatted_history.append({"role": "user", "content": msg["content"]})
-            else:
-                formatted_history.append({"role": "assistant", "content": msg["content"]})
-        
-        return formatted_history
+        # Gradio only accepts role/content, so project each record once
+        return [
+            {"role": "user" if msg["role"] == "user" else "assistant", "content": msg["content"]}
+            for msg in gradio_state.chat_history
+        ]
     
     def get_exercise_info(self, gradio_state: GradioSessionState) -> Dict[str, str]:
         """Get current exercise information for UI display"""